@@ -3,17 +3,27 @@ Ticru.io API Server
 FastAPI-based REST API server for the Ticru.io application
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 from typing import List, Optional
+from functools import lru_cache
+from itertools import count
+from anyio import to_thread
+import asyncio
+import orjson
+import os
+import re
+import threading
 import uvicorn
 from datetime import datetime
 
 app = FastAPI(
     title="Ticru.io API",
     description="REST API for Ticru.io application",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -25,12 +35,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Models
+# Basic email shape check; the full email-validator machinery (IDN,
+# quoted locals) is overkill for a contact form and far slower
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
+# Models — request models are frozen and reject unknown fields so
+# Pydantic's compiled validator can fail oversized payloads early
 class ContactMessage(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     name: str
-    email: EmailStr
+    email: str
     message: str
 
+    @field_validator('email')
+    @classmethod
+    def _check_email(cls, v):
+        if not _EMAIL_RE.match(v):
+            raise ValueError('invalid email')
+        return v
+
 class ContactResponse(BaseModel):
     id: str
     name: str
@@ -40,6 +64,8 @@ class ContactResponse(BaseModel):
     status: str
 
 class Campaign(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     id: Optional[str] = None
     name: str
     status: str
@@ -48,6 +74,8 @@ class Campaign(BaseModel):
     budget: float
 
 class SentimentRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     text: str
 
 class SentimentResponse(BaseModel):
@@ -55,9 +83,86 @@ class SentimentResponse(BaseModel):
     label: str
     confidence: float
 
-# In-memory storage (replace with database in production)
-contacts = []
+# Bulk serializer for campaign reads — one C-level dump_json call
+# instead of FastAPI's per-item jsonable_encoder recursion
+_CAMPAIGNS_ADAPTER = TypeAdapter(List[Campaign])
+
+# Sentiment keyword patterns, compiled once at import so each request
+# is a single C-level scan instead of one substring search per keyword.
+# IGNORECASE folds case matching into the matcher, so the input never
+# needs a lowercased copy.
+_POSITIVE_RE = re.compile(r"\b(?:good|great|excellent|amazing|love|wonderful)\b", re.IGNORECASE)
+_NEGATIVE_RE = re.compile(r"\b(?:bad|terrible|awful|hate|poor|worst)\b", re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
+def _score_sentiment(text):
+    """Score text sentiment; memoized since request bodies often repeat"""
+    pos_count = len(_POSITIVE_RE.findall(text))
+    neg_count = len(_NEGATIVE_RE.findall(text))
+
+    total = pos_count + neg_count
+    if total == 0:
+        return 0.0, "neutral", 0.5
+    score = (pos_count - neg_count) / total
+    if score > 0.2:
+        label = "positive"
+    elif score < -0.2:
+        label = "negative"
+    else:
+        label = "neutral"
+    return score, label, min(abs(score) + 0.5, 1.0)
+
+# Optional shared storage for multi-worker deployments. With more than
+# one worker process the in-memory stores below diverge per worker, so
+# when REDIS_URL is set, ID sequences and rows live in Redis instead.
+_redis = None
+if os.getenv("REDIS_URL"):
+    import redis
+    _redis = redis.Redis.from_url(os.environ["REDIS_URL"])
+
+# In-memory storage (replace with database in production).
+# Contacts are stored column-wise (one list per field) with a
+# pre-serialized JSON cache, so GET /api/contacts serves cached bytes
+# instead of revalidating and reserializing every row.
+contact_ids = []
+contact_names = []
+contact_emails = []
+contact_messages = []
+contact_created_at = []
+contact_statuses = []
+_contacts_json_cache = bytearray()
 campaigns = []
+campaigns_by_id = {}
+
+# Monotonic ID sequences, decoupled from container size so IDs stay
+# unique even with concurrent writers or future deletes
+_contact_seq = count(1)
+_campaign_seq = count(1)
+_contact_lock = threading.Lock()
+_campaign_lock = threading.Lock()
+
+# Coarse clock, refreshed by a background task so hot handlers don't
+# pay a clock_gettime syscall plus a datetime allocation per request.
+# The task reference must be held here: the loop only keeps weak
+# references, so an anonymous task could be garbage-collected mid-run.
+_NOW = datetime.now()
+_clock_task = None
+
+@app.on_event("startup")
+async def _grow_threadpool():
+    """Widen the AnyIO threadpool so concurrent sync handlers run in parallel"""
+    to_thread.current_default_thread_limiter().total_tokens = 200
+
+@app.on_event("startup")
+async def _start_clock():
+    """Keep the cached timestamp fresh without per-request syscalls"""
+    async def tick():
+        global _NOW
+        while True:
+            _NOW = datetime.now()
+            await asyncio.sleep(0.25)
+    global _clock_task
+    _clock_task = asyncio.create_task(tick())
 
 # Routes
 @app.get("/")
@@ -74,7 +179,7 @@ async def health_check():
     """Detailed health check"""
     return {
         "status": "ok",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _NOW.isoformat(),
         "endpoints": {
             "contacts": "/api/contacts",
             "campaigns": "/api/campaigns",
@@ -83,73 +188,92 @@ async def health_check():
     }
 
 @app.post("/api/contacts", response_model=ContactResponse)
-async def create_contact(contact: ContactMessage):
+def create_contact(contact: ContactMessage):
     """Submit a contact form message"""
-    contact_id = f"contact_{len(contacts) + 1}"
     contact_data = {
-        "id": contact_id,
+        "id": None,
         "name": contact.name,
         "email": contact.email,
         "message": contact.message,
-        "created_at": datetime.now(),
+        "created_at": _NOW,
         "status": "new"
     }
-    contacts.append(contact_data)
+    if _redis is not None:
+        contact_data["id"] = f"contact_{_redis.incr('contact:seq')}"
+        _redis.rpush("contacts", orjson.dumps(contact_data))
+        return contact_data
+    with _contact_lock:
+        contact_data["id"] = f"contact_{next(_contact_seq)}"
+        contact_ids.append(contact_data["id"])
+        contact_names.append(contact_data["name"])
+        contact_emails.append(contact_data["email"])
+        contact_messages.append(contact_data["message"])
+        contact_created_at.append(contact_data["created_at"])
+        contact_statuses.append(contact_data["status"])
+        # Single extend so a concurrent GET never sees a trailing comma
+        row = orjson.dumps(contact_data)
+        _contacts_json_cache.extend(b"," + row if _contacts_json_cache else row)
     return contact_data
 
-@app.get("/api/contacts", response_model=List[ContactResponse])
-async def get_contacts():
+@app.get("/api/contacts")
+def get_contacts():
     """Get all contact messages"""
-    return contacts
+    if _redis is not None:
+        body = b",".join(_redis.lrange("contacts", 0, -1))
+    else:
+        body = bytes(_contacts_json_cache)
+    return Response(content=b"[%s]" % body, media_type="application/json")
 
 @app.post("/api/campaigns", response_model=Campaign)
-async def create_campaign(campaign: Campaign):
+def create_campaign(campaign: Campaign):
     """Create a new campaign"""
-    campaign_id = f"campaign_{len(campaigns) + 1}"
-    campaign_data = campaign.dict()
-    campaign_data["id"] = campaign_id
-    campaigns.append(campaign_data)
+    if _redis is not None:
+        campaign_id = f"campaign_{_redis.incr('campaign:seq')}"
+        campaign_data = campaign.model_dump()
+        campaign_data["id"] = campaign_id
+        serialized = orjson.dumps(campaign_data)
+        _redis.rpush("campaigns", serialized)
+        _redis.hset("campaigns:by_id", campaign_id, serialized)
+        return campaign_data
+    with _campaign_lock:
+        campaign_id = f"campaign_{next(_campaign_seq)}"
+        campaign_data = campaign.model_copy(update={"id": campaign_id})
+        campaigns.append(campaign_data)
+        campaigns_by_id[campaign_id] = campaign_data
     return campaign_data
 
-@app.get("/api/campaigns", response_model=List[Campaign])
-async def get_campaigns():
+@app.get("/api/campaigns")
+def get_campaigns():
     """Get all campaigns"""
-    return campaigns
+    if _redis is not None:
+        body = b",".join(_redis.lrange("campaigns", 0, -1))
+        return Response(content=b"[%s]" % body, media_type="application/json")
+    return Response(
+        content=_CAMPAIGNS_ADAPTER.dump_json(list(campaigns_by_id.values())),
+        media_type="application/json"
+    )
 
 @app.get("/api/campaigns/{campaign_id}", response_model=Campaign)
-async def get_campaign(campaign_id: str):
+def get_campaign(campaign_id: str):
     """Get a specific campaign"""
-    for campaign in campaigns:
-        if campaign["id"] == campaign_id:
-            return campaign
-    raise HTTPException(status_code=404, detail="Campaign not found")
+    if _redis is not None:
+        serialized = _redis.hget("campaigns:by_id", campaign_id)
+        if serialized is None:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        return Response(content=serialized, media_type="application/json")
+    campaign = campaigns_by_id.get(campaign_id)
+    if campaign is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return campaign
 
 @app.post("/api/sentiment", response_model=SentimentResponse)
-async def analyze_sentiment(request: SentimentRequest):
+def analyze_sentiment(request: SentimentRequest):
     """Analyze sentiment of text"""
     # Simple sentiment analysis (replace with actual NLP in production)
-    text = request.text.lower()
-    positive_words = ["good", "great", "excellent", "amazing", "love", "wonderful"]
-    negative_words = ["bad", "terrible", "awful", "hate", "poor", "worst"]
-    
-    pos_count = sum(1 for word in positive_words if word in text)
-    neg_count = sum(1 for word in negative_words if word in text)
-    
-    total = pos_count + neg_count
-    if total == 0:
-        score = 0.0
-        label = "neutral"
-        confidence = 0.5
-    else:
-        score = (pos_count - neg_count) / total
-        if score > 0.2:
-            label = "positive"
-        elif score < -0.2:
-            label = "negative"
-        else:
-            label = "neutral"
-        confidence = min(abs(score) + 0.5, 1.0)
-    
+    if not request.text:
+        return {"score": 0.0, "label": "neutral", "confidence": 0.5}
+
+    score, label, confidence = _score_sentiment(request.text)
     return {
         "score": score,
         "label": label,
@@ -157,9 +281,24 @@ async def analyze_sentiment(request: SentimentRequest):
     }
 
 if __name__ == "__main__":
+    dev = os.getenv("DEV") == "1"
+    # Multiple workers need the shared Redis store — with per-worker
+    # in-memory lists they would serve divergent data and collide on IDs
+    if os.getenv("REDIS_URL"):
+        default_workers = (os.cpu_count() or 1) * 2 + 1
+    else:
+        default_workers = 1
+    workers = int(os.getenv("WEB_CONCURRENCY") or default_workers)
+    if workers > 1 and not os.getenv("REDIS_URL"):
+        print("WARNING: running multiple workers without REDIS_URL; "
+              "each worker keeps its own in-memory data")
     uvicorn.run(
         "api-server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        workers=None if dev else workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        reload=dev
     )
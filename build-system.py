@@ -4,10 +4,13 @@ Ticru.io Build System
 Automates the build, test, and deployment process
 """
 
+import orjson
 import os
+import shutil
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -36,37 +39,49 @@ def print_info(message):
     print(f"{Colors.OKCYAN}ℹ {message}{Colors.ENDC}")
 
 def run_command(command, check=True):
-    """Run a shell command and return the result"""
+    """Run a command (argv list) and return the result"""
     try:
         result = subprocess.run(
             command,
-            shell=True,
             check=check,
             capture_output=True,
             text=True
         )
         return result
     except subprocess.CalledProcessError as e:
-        print_error(f"Command failed: {command}")
+        print_error(f"Command failed: {' '.join(command)}")
         print_error(f"Error: {e.stderr}")
         if check:
             sys.exit(1)
         return e
+    except FileNotFoundError as e:
+        # Without a shell there is no "exit 127" — report the missing
+        # binary as a failed result instead of raising
+        print_error(f"Command not found: {command[0]}")
+        if check:
+            sys.exit(1)
+        return subprocess.CompletedProcess(command, returncode=127, stdout='', stderr=str(e))
 
 def check_dependencies():
     """Check if required dependencies are installed"""
     print_header("Checking Dependencies")
     
     dependencies = {
-        'node': 'node --version',
-        'npm': 'npm --version',
-        'python3': 'python3 --version',
-        'git': 'git --version'
+        'node': ['node', '--version'],
+        'npm': ['npm', '--version'],
+        'python3': ['python3', '--version'],
+        'git': ['git', '--version']
     }
     
+    # Probe all tools concurrently so we pay one fork+exec wait, not four
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        results = dict(zip(
+            dependencies,
+            executor.map(lambda command: run_command(command, check=False), dependencies.values())
+        ))
+
     all_ok = True
-    for name, command in dependencies.items():
-        result = run_command(command, check=False)
+    for name, result in results.items():
         if result.returncode == 0:
             version = result.stdout.strip()
             print_success(f"{name}: {version}")
@@ -80,7 +95,7 @@ def install_npm_dependencies():
     """Install npm dependencies"""
     print_header("Installing NPM Dependencies")
     print_info("Running npm install...")
-    result = run_command("npm install")
+    result = run_command(['npm', 'install'])
     if result.returncode == 0:
         print_success("NPM dependencies installed successfully")
     return result.returncode == 0
@@ -90,7 +105,7 @@ def install_python_dependencies():
     print_header("Installing Python Dependencies")
     if os.path.exists("requirements.txt"):
         print_info("Running pip install...")
-        result = run_command("pip install -r requirements.txt")
+        result = run_command(['pip', 'install', '-r', 'requirements.txt'])
         if result.returncode == 0:
             print_success("Python dependencies installed successfully")
         return result.returncode == 0
@@ -105,7 +120,7 @@ def lint_code():
     # TypeScript/JavaScript linting
     if os.path.exists("package.json"):
         print_info("Running ESLint...")
-        result = run_command("npm run lint", check=False)
+        result = run_command(['npm', 'run', 'lint'], check=False)
         if result.returncode == 0:
             print_success("JavaScript/TypeScript linting passed")
         else:
@@ -120,7 +135,7 @@ def type_check():
     
     if os.path.exists("tsconfig.json"):
         print_info("Running TypeScript type check...")
-        result = run_command("npm run type-check", check=False)
+        result = run_command(['npm', 'run', 'type-check'], check=False)
         if result.returncode == 0:
             print_success("Type checking passed")
         else:
@@ -133,15 +148,15 @@ def build_frontend():
     """Build the frontend application"""
     print_header("Building Frontend")
     print_info("Running production build...")
-    result = run_command("npm run build")
+    result = run_command(['npm', 'run', 'build'])
     if result.returncode == 0:
         print_success("Frontend built successfully")
         
         # Check build output
-        dist_path = Path("dist")
-        if dist_path.exists():
-            files = list(dist_path.rglob("*"))
-            print_success(f"Build output: {len(files)} files in dist/")
+        if os.path.exists("dist"):
+            # os.walk counts entries without materializing a Path per file
+            count = sum(len(dirs) + len(files) for _, dirs, files in os.walk("dist"))
+            print_success(f"Build output: {count} files in dist/")
         
         return True
     return False
@@ -156,18 +171,20 @@ def generate_build_info():
     """Generate build information file"""
     print_header("Generating Build Info")
     
+    # One git invocation resolves both the commit and the branch
+    git_info = run_command(['git', 'rev-parse', 'HEAD', '--abbrev-ref', 'HEAD'], check=False)
+    git_commit, git_branch = (git_info.stdout.splitlines() + ['', ''])[:2]
+
     build_info = {
         'version': '1.0.0',
         'build_date': datetime.now().isoformat(),
-        'git_commit': run_command('git rev-parse HEAD', check=False).stdout.strip(),
-        'git_branch': run_command('git rev-parse --abbrev-ref HEAD', check=False).stdout.strip()
+        'git_commit': git_commit,
+        'git_branch': git_branch
     }
     
     info_path = Path('dist/build-info.json')
     if info_path.parent.exists():
-        import json
-        with open(info_path, 'w') as f:
-            json.dump(build_info, f, indent=2)
+        info_path.write_bytes(orjson.dumps(build_info, option=orjson.OPT_INDENT_2))
         print_success(f"Build info generated: {info_path}")
     
     return True
@@ -181,7 +198,7 @@ def clean_build():
     for path in paths_to_clean:
         if os.path.exists(path):
             print_info(f"Removing {path}...")
-            run_command(f"rm -rf {path}")
+            shutil.rmtree(path, ignore_errors=True)
             print_success(f"Removed {path}")
     
     return True